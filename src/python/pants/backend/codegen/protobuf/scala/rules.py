@@ -255,36 +255,35 @@ async def setup_scalapb_shim_classfiles(
     scalapb_shim_source = FileContent("ScalaPBShim.scala", scalapb_shim_content)
 
     lockfile_request = GenerateJvmLockfileFromTool.create(scalapb)
-    scala_artifacts = await Get(
-        ScalaArtifactsForVersionResult, ScalaArtifactsForVersionRequest(SHIM_SCALA_VERSION)
+    scala_artifacts, shim_classpath, source_digest = await MultiGet(
+        Get(ScalaArtifactsForVersionResult, ScalaArtifactsForVersionRequest(SHIM_SCALA_VERSION)),
+        Get(ToolClasspath, ToolClasspathRequest(prefix="__shimcp", lockfile=lockfile_request)),
+        Get(Digest, CreateDigest([scalapb_shim_source, Directory(dest_dir)])),
     )
-    tool_classpath, shim_classpath, source_digest = await MultiGet(
-        Get(
-            ToolClasspath,
-            ToolClasspathRequest(
-                prefix="__toolcp",
-                artifact_requirements=ArtifactRequirements.from_coordinates(
-                    scala_artifacts.all_coordinates
-                ),
+    tool_classpath = await Get(
+        ToolClasspath,
+        ToolClasspathRequest(
+            prefix="__toolcp",
+            artifact_requirements=ArtifactRequirements.from_coordinates(
+                scala_artifacts.all_coordinates
             ),
         ),
-        Get(ToolClasspath, ToolClasspathRequest(prefix="__shimcp", lockfile=lockfile_request)),
-        Get(Digest, CreateDigest([scalapb_shim_source, Directory(dest_dir)])),
     )
 
     merged_digest = await Get(
         Digest, MergeDigests((tool_classpath.digest, shim_classpath.digest, source_digest))
     )
 
+    tool_classpath_entries = tuple(tool_classpath.classpath_entries())
     process_result = await Get(
         ProcessResult,
         JvmProcess(
             jdk=jdk,
-            classpath_entries=tool_classpath.classpath_entries(),
+            classpath_entries=tool_classpath_entries,
             argv=[
                 "scala.tools.nsc.Main",
                 "-bootclasspath",
-                ":".join(tool_classpath.classpath_entries()),
+                ":".join(tool_classpath_entries),
                 "-classpath",
                 ":".join(shim_classpath.classpath_entries()),
                 "-d",
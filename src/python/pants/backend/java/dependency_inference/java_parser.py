@@ -141,14 +141,8 @@ def _load_javaparser_launcher_source() -> bytes:
 @rule
 async def build_processors(jdk: InternalJdk) -> JavaParserCompiledClassfiles:
     dest_dir = "classfiles"
-    parser_lockfile_request = await Get(
-        GenerateJvmLockfileFromTool, JavaParserToolLockfileSentinel()
-    )
-    materialized_classpath, source_digest = await MultiGet(
-        Get(
-            ToolClasspath,
-            ToolClasspathRequest(prefix="__toolcp", lockfile=parser_lockfile_request),
-        ),
+    parser_lockfile_request, source_digest = await MultiGet(
+        Get(GenerateJvmLockfileFromTool, JavaParserToolLockfileSentinel()),
         Get(
             Digest,
             CreateDigest(
@@ -162,6 +156,10 @@ async def build_processors(jdk: InternalJdk) -> JavaParserCompiledClassfiles:
             ),
         ),
     )
+    materialized_classpath = await Get(
+        ToolClasspath,
+        ToolClasspathRequest(prefix="__toolcp", lockfile=parser_lockfile_request),
+    )
 
     merged_digest = await Get(
         Digest,
@@ -180,6 +178,7 @@ async def build_processors(jdk: InternalJdk) -> JavaParserCompiledClassfiles:
             classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
             argv=[
                 "com.sun.tools.javac.Main",
+                "-proc:none",
                 "-cp",
                 ":".join(materialized_classpath.classpath_entries()),
                 "-d",
@@ -233,11 +233,8 @@ async def setup_kotlin_parser_classfiles(jdk: InternalJdk) -> KotlinParserCompil
 
     parser_source = FileContent("KotlinParser.kt", parser_source_content)
 
-    parser_lockfile_request = await Get(
-        GenerateJvmLockfileFromTool, KotlinParserToolLockfileSentinel()
-    )
-
-    tool_classpath, parser_classpath, source_digest = await MultiGet(
+    parser_lockfile_request, tool_classpath, source_digest = await MultiGet(
+        Get(GenerateJvmLockfileFromTool, KotlinParserToolLockfileSentinel()),
         Get(
             ToolClasspath,
             ToolClasspathRequest(
@@ -253,12 +250,12 @@ async def setup_kotlin_parser_classfiles(jdk: InternalJdk) -> KotlinParserCompil
                 ),
             ),
         ),
-        Get(
-            ToolClasspath,
-            ToolClasspathRequest(prefix="__parsercp", lockfile=parser_lockfile_request),
-        ),
         Get(Digest, CreateDigest([parser_source, Directory(dest_dir)])),
     )
+    parser_classpath = await Get(
+        ToolClasspath,
+        ToolClasspathRequest(prefix="__parsercp", lockfile=parser_lockfile_request),
+    )
 
     merged_digest = await Get(
         Digest,
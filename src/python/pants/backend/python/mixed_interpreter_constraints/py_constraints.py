@@ -80,13 +80,18 @@ async def py_constraints(
             return PyConstraintsGoal(exit_code=1)
 
         all_targets = await Get(AllTargets)
-        all_python_targets = tuple(
-            t for t in all_targets if t.has_field(InterpreterConstraintsField)
-        )
+        # Capture each target's field while filtering, so that we don't need to look it up again
+        # when computing the per-target constraints.
+        ic_field_per_tgt = [
+            (t, t[InterpreterConstraintsField])
+            for t in all_targets
+            if t.has_field(InterpreterConstraintsField)
+        ]
+        all_python_targets = tuple(tgt for tgt, _ in ic_field_per_tgt)
 
         constraints_per_tgt = [
-            InterpreterConstraints.create_from_targets([tgt], python_setup)
-            for tgt in all_python_targets
+            InterpreterConstraints.create_from_compatibility_fields([ic_field], python_setup)
+            for _, ic_field in ic_field_per_tgt
         ]
 
         transitive_targets_per_tgt = await MultiGet(
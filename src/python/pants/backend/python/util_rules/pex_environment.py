@@ -222,11 +222,13 @@ class CompletePexEnvironment:
 
     def environment_dict(
         self, *, python: PythonExecutable | PythonBuildStandaloneBinary | None = None
-    ) -> Mapping[str, str]:
+    ) -> dict[str, str]:
         """The environment to use for running anything with PEX.
 
         If the Process is run with a pre-selected Python interpreter, set `python_configured=True`
         to avoid PEX from trying to find a new interpreter.
+
+        A fresh dict is returned on each call, so callers may extend it in place.
         """
         path = os.pathsep.join(self._pex_environment.path)
         subprocess_env_dict = dict(self._pex_environment.subprocess_environment_dict)
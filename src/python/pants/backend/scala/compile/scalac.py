@@ -150,7 +150,10 @@ async def compile_scala_source(
 
     user_classpath = Classpath(direct_dependency_classpath_entries, request.resolve)
 
-    tool_classpath, sources_digest, jdk = await MultiGet(
+    output_file = compute_output_jar_filename(request.component)
+    compilation_output_dir = "__out"
+
+    tool_classpath, sources_digest, compilation_empty_dir, jdk = await MultiGet(
         Get(
             ToolClasspath,
             ToolClasspathRequest(
@@ -168,6 +171,7 @@ async def compile_scala_source(
                 (sources.snapshot.digest for _, sources in component_members_and_scala_source_files)
             ),
         ),
+        Get(Digest, CreateDigest([Directory(compilation_output_dir)])),
         Get(JdkEnvironment, JdkRequest, JdkRequest.from_target(request.component)),
     )
 
@@ -180,9 +184,6 @@ async def compile_scala_source(
 
     classpath_arg = ":".join(user_classpath.immutable_inputs_args(prefix=usercp))
 
-    output_file = compute_output_jar_filename(request.component)
-    compilation_output_dir = "__out"
-    compilation_empty_dir = await Get(Digest, CreateDigest([Directory(compilation_output_dir)]))
     merged_digest = await Get(Digest, MergeDigests([sources_digest, compilation_empty_dir]))
 
     compile_result = await Get(
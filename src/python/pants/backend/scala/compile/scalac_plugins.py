@@ -184,24 +184,23 @@ async def resolve_scala_plugins_for_target(
         plugin_names_by_resolve = scalac.parsed_default_plugins()
         plugin_names = tuple(plugin_names_by_resolve.get(resolve, ()))
 
-    candidate_plugins = []
-    candidate_artifacts = []
-    for plugin in all_scala_plugins:
-        if _plugin_name(plugin) not in plugin_names:
-            continue
-        candidate_plugins.append(plugin)
-        artifact_field = plugin[ScalacPluginArtifactField]
-        wrapped_target = await _resolve_scalac_plugin_artifact(
-            artifact_field,
+    candidate_plugins = [
+        plugin for plugin in all_scala_plugins if _plugin_name(plugin) in plugin_names
+    ]
+    candidate_artifacts = await MultiGet(
+        _resolve_scalac_plugin_artifact(
+            plugin[ScalacPluginArtifactField],
             request.target,
             target_types_to_generate_requests,
             local_environment_name,
             field_defaults,
         )
-        candidate_artifacts.append(wrapped_target.target)
+        for plugin in candidate_plugins
+    )
 
     plugins: dict[str, tuple[Target, Target]] = {}  # Maps plugin name to relevant JVM artifact
-    for plugin, artifact in zip(candidate_plugins, candidate_artifacts):
+    for plugin, wrapped_artifact in zip(candidate_plugins, candidate_artifacts):
+        artifact = wrapped_artifact.target
         if artifact[JvmResolveField].normalized_value(jvm) != resolve:
             continue
 
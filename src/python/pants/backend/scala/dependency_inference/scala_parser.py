@@ -362,12 +362,13 @@ async def setup_scala_parser_classfiles(jdk: InternalJdk) -> ScalaParserCompiled
 
     parser_source = FileContent("ScalaParser.scala", parser_source_content)
 
-    parser_lockfile_request, scala_artifacts = await MultiGet(
+    parser_lockfile_request, scala_artifacts, source_digest = await MultiGet(
         Get(GenerateJvmLockfileFromTool, ScalaParserToolLockfileSentinel()),
         Get(ScalaArtifactsForVersionResult, ScalaArtifactsForVersionRequest(_PARSER_SCALA_VERSION)),
+        Get(Digest, CreateDigest([parser_source, Directory(dest_dir)])),
     )
 
-    tool_classpath, parser_classpath, source_digest = await MultiGet(
+    tool_classpath, parser_classpath = await MultiGet(
         Get(
             ToolClasspath,
             ToolClasspathRequest(
@@ -381,7 +382,6 @@ async def setup_scala_parser_classfiles(jdk: InternalJdk) -> ScalaParserCompiled
             ToolClasspath,
             ToolClasspathRequest(prefix="__parsercp", lockfile=parser_lockfile_request),
         ),
-        Get(Digest, CreateDigest([parser_source, Directory(dest_dir)])),
     )
 
     merged_digest = await Get(
@@ -395,15 +395,16 @@ async def setup_scala_parser_classfiles(jdk: InternalJdk) -> ScalaParserCompiled
         ),
     )
 
+    tool_classpath_entries = tuple(tool_classpath.classpath_entries())
     process_result = await Get(
         ProcessResult,
         JvmProcess(
             jdk=jdk,
-            classpath_entries=tool_classpath.classpath_entries(),
+            classpath_entries=tool_classpath_entries,
             argv=[
                 "scala.tools.nsc.Main",
                 "-bootclasspath",
-                ":".join(tool_classpath.classpath_entries()),
+                ":".join(tool_classpath_entries),
                 "-classpath",
                 ":".join(parser_classpath.classpath_entries()),
                 "-d",
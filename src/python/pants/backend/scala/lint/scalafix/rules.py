@@ -162,11 +162,9 @@ async def _partition_scalafix(
     # Determine the Scala version being used by each file.
     # A single file can be mapped to more than one Scala version in cross-compilation scenarios.
     scala_versions_by_filepath: dict[str, set[ScalaVersion]] = defaultdict(set)
-    for field_set in request.field_sets:
+    for filepath, field_set in zip(filepaths, request.field_sets):
         resolve = field_set.resolve.normalized_value(jvm)
-        scala_versions_by_filepath[field_set.source.file_path].add(
-            scala.version_for_resolve(resolve)
-        )
+        scala_versions_by_filepath[filepath].add(scala.version_for_resolve(resolve))
 
     # Partition the work by which source files share the same config file and Scala version (regardless of directory).
     partitioned_source_files: dict[tuple[str, ScalaVersion], set[str]] = defaultdict(set)
@@ -327,13 +325,17 @@ async def _run_scalafix_process(
 
 @rule
 async def scalafix_fix(request: ScalafixFixRequest.Batch) -> FixResult:
-    source_roots = await Get(
-        SourceRootsResult, SourceRootsRequest, SourceRootsRequest.for_files(request.snapshot.files)
+    # We need to strip the source files to get semantic rules find SemanticDB metadata in the classpath,
+    # and to know their source roots to restore them afterwards.
+    source_roots, stripped_source_files = await MultiGet(
+        Get(
+            SourceRootsResult,
+            SourceRootsRequest,
+            SourceRootsRequest.for_files(request.snapshot.files),
+        ),
+        Get(StrippedSourceFiles, SourceFiles(request.snapshot, ())),
     )
 
-    # We need to strip the source files to get semantic rules find SemanticDB metadata in the classpath
-    stripped_source_files = await Get(StrippedSourceFiles, SourceFiles(request.snapshot, ()))
-
     process_result = await Get(
         FallibleProcessResult,
         _ScalafixProcess(
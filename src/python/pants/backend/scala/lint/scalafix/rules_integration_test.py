@@ -2,8 +2,10 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import shutil
+from pathlib import Path
 from textwrap import dedent
-from typing import Any, Callable, TypeVar, overload
+from typing import Any, Callable, Sequence, TypeVar, overload
 
 import pytest
 
@@ -36,6 +38,7 @@ from pants.core.util_rules import config_files, source_files, stripped_source_fi
 from pants.core.util_rules.external_tool import rules as external_tool_rules
 from pants.core.util_rules.partitions import Partition
 from pants.engine.fs import PathGlobs, Snapshot
+from pants.engine.internals.selectors import Params
 from pants.engine.rules import QueryRule
 from pants.engine.target import Target
 from pants.jvm import classpath
@@ -50,8 +53,10 @@ from pants.jvm.util_rules import rules as util_rules
 from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, RuleRunner, logging
 
 
-@pytest.fixture
-def rule_runner() -> RuleRunner:
+@pytest.fixture(scope="module")
+def _shared_rule_runner() -> RuleRunner:
+    # Building the rule graph for the JVM backends dominates the cost of each test, so it is
+    # done once per module, and the `rule_runner` fixture resets the workspace between tests.
     rule_runner = RuleRunner(
         rules=[
             *config_files.rules(),
@@ -87,6 +92,23 @@ def rule_runner() -> RuleRunner:
     return rule_runner
 
 
+@pytest.fixture
+def rule_runner(_shared_rule_runner: RuleRunner) -> RuleRunner:
+    build_root = Path(_shared_rule_runner.build_root)
+    for child in build_root.iterdir():
+        if child.name == ".pants.d":
+            continue
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+    _shared_rule_runner.scheduler.invalidate_all_files()
+    # Targets are parsed before each test applies its own options, so make sure that the options
+    # set by a previous test don't leak into them.
+    _shared_rule_runner.set_options([], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    return _shared_rule_runner
+
+
 @overload
 def run_scalafix_fix(
     rule_runner: RuleRunner,
@@ -116,23 +138,28 @@ def run_scalafix_fix(
     extra_options: list[str] = [],
     expected_partitions: dict[str, tuple[str, ...]] | None = None,
 ) -> FixResult | list[FixResult]:
-    def create_batch_request(
-        name: str, partition: Partition[str, ScalafixPartitionInfo]
-    ) -> ScalafixFixRequest.Batch:
-        snapshot = rule_runner.request(Snapshot, [PathGlobs(partition.elements)])
-        return ScalafixFixRequest.Batch(
-            name,
-            partition.elements,
-            partition_metadata=partition.metadata,
-            snapshot=snapshot,
+    def create_batch_requests(
+        name: str, partitions: Sequence[Partition[str, ScalafixPartitionInfo]]
+    ) -> list[ScalafixFixRequest.Batch]:
+        snapshots = _request_concurrently(
+            rule_runner, Snapshot, [PathGlobs(partition.elements) for partition in partitions]
         )
+        return [
+            ScalafixFixRequest.Batch(
+                name,
+                partition.elements,
+                partition_metadata=partition.metadata,
+                snapshot=snapshot,
+            )
+            for partition, snapshot in zip(partitions, snapshots)
+        ]
 
     return _run_scalafix(
         rule_runner,
         targets,
         output_type=FixResult,
         paritition_req_call=lambda x: ScalafixFixRequest.PartitionRequest(x),
-        batch_req_call=create_batch_request,
+        batch_req_call=create_batch_requests,
         extra_options=extra_options,
         expected_partitions=expected_partitions,
     )
@@ -167,19 +194,22 @@ def run_scalafix_lint(
     extra_options: list[str] = [],
     expected_partitions: dict[str, tuple[str, ...]] | None = None,
 ) -> LintResult | list[LintResult]:
-    def create_batch_request(
-        name: str, partition: Partition[str, ScalafixPartitionInfo]
-    ) -> ScalafixLintRequest.Batch:
-        return ScalafixLintRequest.Batch(
-            name, partition.elements, partition_metadata=partition.metadata
-        )
+    def create_batch_requests(
+        name: str, partitions: Sequence[Partition[str, ScalafixPartitionInfo]]
+    ) -> list[ScalafixLintRequest.Batch]:
+        return [
+            ScalafixLintRequest.Batch(
+                name, partition.elements, partition_metadata=partition.metadata
+            )
+            for partition in partitions
+        ]
 
     return _run_scalafix(
         rule_runner,
         targets,
         output_type=LintResult,
         paritition_req_call=lambda x: ScalafixLintRequest.PartitionRequest(x),
-        batch_req_call=create_batch_request,
+        batch_req_call=create_batch_requests,
         extra_options=extra_options,
         expected_partitions=expected_partitions,
     )
@@ -188,13 +218,24 @@ def run_scalafix_lint(
 _Out = TypeVar("_Out")
 
 
+def _request_concurrently(
+    rule_runner: RuleRunner, output_type: type[_Out], inputs: Sequence[Any]
+) -> list[_Out]:
+    """Like `RuleRunner.request`, but requests the output for each input in a single execution, so
+    that the engine is free to compute them concurrently."""
+    extra_params = [rule_runner.inherent_environment] if rule_runner.inherent_environment else []
+    return rule_runner.scheduler.product_request(
+        output_type, [Params(input, *extra_params) for input in inputs]
+    )
+
+
 def _run_scalafix(
     rule_runner: RuleRunner,
     targets: list[Target],
     *,
     output_type: type[_Out],
     paritition_req_call: Callable[[tuple[ScalafixFieldSet, ...]], Any],
-    batch_req_call: Callable[[str, Partition[str, ScalafixPartitionInfo]], Any],
+    batch_req_call: Callable[[str, Sequence[Partition[str, ScalafixPartitionInfo]]], list[Any]],
     extra_options: list[str] = [],
     expected_partitions: dict[str, tuple[str, ...]] | None = None,
 ) -> _Out | list[_Out]:
@@ -205,13 +246,9 @@ def _run_scalafix(
         Partitions[ScalafixPartitionInfo], [paritition_req_call(tuple(field_sets))]
     )
 
-    results = [
-        rule_runner.request(
-            output_type,
-            [batch_req_call("scalafix", partition)],
-        )
-        for partition in partitions
-    ]
+    results = _request_concurrently(
+        rule_runner, output_type, batch_req_call("scalafix", tuple(partitions))
+    )
     return results if expected_partitions else results[0]
 
 
@@ -334,7 +371,7 @@ def test_multiple_config_files(rule_runner: RuleRunner) -> None:
     assert lint_results[1].exit_code != 0
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def semanticdb_lockfile_def() -> JVMLockfileFixtureDefinition:
     return JVMLockfileFixtureDefinition(
         "semanticdb-scalac-2.13.12.test.lock",
@@ -342,7 +379,7 @@ def semanticdb_lockfile_def() -> JVMLockfileFixtureDefinition:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def semanticdb_lockfile(
     semanticdb_lockfile_def: JVMLockfileFixtureDefinition, request
 ) -> JVMLockfileFixture:
@@ -403,7 +440,7 @@ def test_builtin_semanticdb_rule(
     assert fix_result.did_change is True
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scala_rewrites_lockfile_def() -> JVMLockfileFixtureDefinition:
     return JVMLockfileFixtureDefinition(
         "scala-rewrites-2.13.12.test.lock",
@@ -415,7 +452,7 @@ def scala_rewrites_lockfile_def() -> JVMLockfileFixtureDefinition:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scala_rewrites_lockfile(
     scala_rewrites_lockfile_def: JVMLockfileFixtureDefinition, request
 ) -> JVMLockfileFixture:
@@ -484,7 +521,7 @@ def test_run_custom_rule(
     assert fix_result.did_change is True
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scala3_lockfile_def() -> JVMLockfileFixtureDefinition:
     return JVMLockfileFixtureDefinition(
         "scala3.test.lock",
@@ -492,7 +529,7 @@ def scala3_lockfile_def() -> JVMLockfileFixtureDefinition:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scala3_lockfile(
     scala3_lockfile_def: JVMLockfileFixtureDefinition, request
 ) -> JVMLockfileFixture:
@@ -6,6 +6,7 @@ from __future__ import annotations
 from pants.backend.scala.util_rules.versions import ScalaVersion
 from pants.option.option_types import BoolOption, DictOption
 from pants.option.subsystem import Subsystem
+from pants.util.memo import memoized_method
 from pants.util.strutil import softwrap
 
 DEFAULT_SCALA_VERSION = ScalaVersion.parse("2.13.6")
@@ -39,6 +40,7 @@ class ScalaSubsystem(Subsystem):
         advanced=True,
     )
 
+    @memoized_method
     def version_for_resolve(self, resolve: str) -> ScalaVersion:
         version = self._version_for_resolve.get(resolve)
         if version:
@@ -8,7 +8,7 @@ from typing import ClassVar
 
 from pants.backend.scala.subsystems.scala import ScalaSubsystem
 from pants.backend.scala.subsystems.scala_infer import ScalaInferSubsystem
-from pants.backend.scala.util_rules.versions import ScalaCrossVersionMode
+from pants.backend.scala.util_rules.versions import ScalaCrossVersionMode, ScalaVersion
 from pants.build_graph.address import AddressInput
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.core.goals.test import TestExtraEnvVarsField, TestTimeoutField
@@ -104,6 +104,16 @@ class ScalaConsumedPluginNamesField(StringSequenceField):
     required = False
 
 
+# The fields moved from every Scala target generator to the targets it generates.
+_SCALA_SOURCE_MOVED_FIELDS = (
+    ScalaDependenciesField,
+    ScalaConsumedPluginNamesField,
+    JvmResolveField,
+    JvmJdkField,
+    JvmProvidesTypesField,
+)
+
+
 @dataclass(frozen=True)
 class ScalaFieldSet(JvmRunnableSourceFieldSet):
     required_fields = (ScalaSourceField,)
@@ -181,13 +191,9 @@ class ScalatestTestsGeneratorTarget(TargetFilesGenerator):
     generated_target_cls = ScalatestTestTarget
     copied_fields = COMMON_TARGET_FIELDS
     moved_fields = (
-        ScalaDependenciesField,
-        ScalaConsumedPluginNamesField,
+        *_SCALA_SOURCE_MOVED_FIELDS,
         ScalatestTestTimeoutField,
         ScalatestTestExtraEnvVarsField,
-        JvmJdkField,
-        JvmProvidesTypesField,
-        JvmResolveField,
     )
     settings_request_cls = ScalaSettingsRequest
     help = help_text(
@@ -254,13 +260,9 @@ class ScalaJunitTestsGeneratorTarget(TargetFilesGenerator):
     generated_target_cls = ScalaJunitTestTarget
     copied_fields = COMMON_TARGET_FIELDS
     moved_fields = (
-        ScalaDependenciesField,
-        ScalaConsumedPluginNamesField,
+        *_SCALA_SOURCE_MOVED_FIELDS,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
-        JvmJdkField,
-        JvmProvidesTypesField,
-        JvmResolveField,
     )
     settings_request_cls = ScalaSettingsRequest
     help = "Generate a `scala_junit_test` target for each file in the `sources` field."
@@ -292,11 +294,9 @@ class ScalaSourceTarget(Target):
 
 
 class ScalaSourcesGeneratorSourcesField(ScalaGeneratorSourcesField):
-    default = (
-        "*.scala",
-        *(f"!{pat}" for pat in (ScalaJunitTestsGeneratorSourcesField.default)),
-        *(f"!{pat}" for pat in (ScalatestTestsGeneratorSourcesField.default)),
-    )
+    # NB: This must exclude the defaults of `ScalaJunitTestsGeneratorSourcesField` and
+    # `ScalatestTestsGeneratorSourcesField`, which is checked in `target_types_test.py`.
+    default = ("*.scala", "!*Test.scala", "!*Spec.scala", "!*Suite.scala")
     help = generate_multiple_sources_field_help_message(
         "Example: `sources=['Example.scala', 'New*.scala', '!OldIgnore.scala']`"
     )
@@ -325,12 +325,8 @@ class ScalaSourcesGeneratorTarget(TargetFilesGenerator):
     generated_target_cls = ScalaSourceTarget
     copied_fields = COMMON_TARGET_FIELDS
     moved_fields = (
-        ScalaDependenciesField,
-        ScalaConsumedPluginNamesField,
-        JvmResolveField,
-        JvmJdkField,
+        *_SCALA_SOURCE_MOVED_FIELDS,
         JvmMainClassNameField,
-        JvmProvidesTypesField,
     )
     settings_request_cls = ScalaSettingsRequest
     help = "Generate a `scala_source` target for each file in the `sources` field."
@@ -427,6 +423,9 @@ class ScalaArtifactCrossversionField(StringField):
     valid_choices = ScalaCrossVersionMode
 
 
+_CROSSVERSION_MODES_BY_VALUE = {mode.value: mode for mode in ScalaCrossVersionMode}
+
+
 @dataclass(frozen=True)
 class ScalaArtifactExclusion(JvmArtifactExclusion):
     alias = "scala_exclude"
@@ -441,14 +440,13 @@ class ScalaArtifactExclusion(JvmArtifactExclusion):
 
     def validate(self, address: Address) -> set[str]:
         errors = super().validate(address)
-        valid_crossversions = [x.value for x in ScalaCrossVersionMode]
-        if self.crossversion not in valid_crossversions:
+        if self.crossversion not in _CROSSVERSION_MODES_BY_VALUE:
             errors.add(
                 softwrap(
                     f"""
                     Invalid `crossversion` value '{self.crossversion}' in in list of
                     exclusions at target: {address}. Valid values are:
-                    {', '.join(valid_crossversions)}
+                    {', '.join(mode.value for mode in ScalaCrossVersionMode)}
                     """
                 )
             )
@@ -526,6 +524,19 @@ class GenerateJvmArtifactForScalaTargets(GenerateTargetsRequest):
     generate_from = ScalaArtifactTarget
 
 
+def _to_jvm_artifact_exclusion(
+    exclusion: JvmArtifactExclusion, scala_version: ScalaVersion
+) -> JvmArtifactExclusion:
+    if not isinstance(exclusion, ScalaArtifactExclusion):
+        return exclusion
+
+    excluded_artifact_name = None
+    if exclusion.artifact:
+        cross_mode = _CROSSVERSION_MODES_BY_VALUE[exclusion.crossversion]
+        excluded_artifact_name = f"{exclusion.artifact}_{scala_version.crossversion(cross_mode)}"
+    return JvmArtifactExclusion(group=exclusion.group, artifact=excluded_artifact_name)
+
+
 @rule
 async def generate_jvm_artifact_targets(
     request: GenerateJvmArtifactForScalaTargets,
@@ -538,26 +549,17 @@ async def generate_jvm_artifact_targets(
     scala_version = scala.version_for_resolve(resolve_name)
 
     exclusions_field = {}
-    if field_set.exclusions.value:
-        exclusions = []
-        for exclusion in field_set.exclusions.value:
-            if not isinstance(exclusion, ScalaArtifactExclusion):
-                exclusions.append(exclusion)
-            else:
-                excluded_artifact_name = None
-                if exclusion.artifact:
-                    cross_mode = ScalaCrossVersionMode(exclusion.crossversion)
-                    excluded_artifact_name = (
-                        f"{exclusion.artifact}_{scala_version.crossversion(cross_mode)}"
-                    )
-                exclusions.append(
-                    JvmArtifactExclusion(group=exclusion.group, artifact=excluded_artifact_name)
-                )
+    exclusions = field_set.exclusions.value
+    if exclusions:
+        if any(isinstance(exclusion, ScalaArtifactExclusion) for exclusion in exclusions):
+            exclusions = tuple(
+                _to_jvm_artifact_exclusion(exclusion, scala_version) for exclusion in exclusions
+            )
         exclusions_field[JvmArtifactExclusionsField.alias] = exclusions
 
-    cross_mode = ScalaCrossVersionMode(
+    cross_mode = _CROSSVERSION_MODES_BY_VALUE[
         field_set.crossversion.value or ScalaArtifactCrossversionField.default
-    )
+    ]
     artifact_name = f"{field_set.artifact.value}_{scala_version.crossversion(cross_mode)}"
     jvm_artifact_target = JvmArtifactTarget(
         {
@@ -6,7 +6,13 @@ from textwrap import dedent
 
 import pytest
 
-from pants.backend.scala.target_types import ScalaArtifactExclusion, ScalaArtifactTarget
+from pants.backend.scala.target_types import (
+    ScalaArtifactExclusion,
+    ScalaArtifactTarget,
+    ScalaJunitTestsGeneratorSourcesField,
+    ScalaSourcesGeneratorSourcesField,
+    ScalatestTestsGeneratorSourcesField,
+)
 from pants.backend.scala.target_types import rules as target_types_rules
 from pants.build_graph.address import Address
 from pants.engine.internals.graph import _TargetParametrizations, _TargetParametrizationsRequest
@@ -275,3 +281,11 @@ def test_generate_jvm_artifacts_for_parametrized_resolve(rule_runner: RuleRunner
             ),
         },
     )
+
+
+def test_scala_sources_default_excludes_test_sources() -> None:
+    assert ScalaSourcesGeneratorSourcesField.default == (
+        "*.scala",
+        *(f"!{pat}" for pat in ScalaJunitTestsGeneratorSourcesField.default),
+        *(f"!{pat}" for pat in ScalatestTestsGeneratorSourcesField.default),
+    )
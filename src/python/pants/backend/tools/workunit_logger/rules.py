@@ -2,7 +2,8 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 import json
 import logging
-from typing import Any, Dict, Tuple
+import os
+from typing import Any, Optional, Set, TextIO, Tuple
 
 from pants.engine.internals.scheduler import Workunit
 from pants.engine.rules import collect_rules, rule
@@ -19,27 +20,22 @@ from pants.option.subsystem import Subsystem
 logger = logging.getLogger(__name__)
 
 
-def just_dump_map(workunits_map):
-    return [
-        {
-            k: v
-            for k, v in wu.items()
-            if k
-            in (
-                "name",
-                "span_id",
-                "level",
-                "parent_id",
-                "start_secs",
-                "start_nanos",
-                "description",
-                "duration_secs",
-                "duration_nanos",
-                "metadata",
-            )
-        }
-        for wu in workunits_map.values()
-    ]
+_LOGGED_WORKUNIT_KEYS = (
+    "name",
+    "span_id",
+    "level",
+    "parent_id",
+    "start_secs",
+    "start_nanos",
+    "description",
+    "duration_secs",
+    "duration_nanos",
+    "metadata",
+)
+
+
+def just_dump(wu):
+    return {k: wu[k] for k in _LOGGED_WORKUNIT_KEYS if k in wu}
 
 
 class WorkunitLoggerCallback(WorkunitsCallback):
@@ -47,12 +43,25 @@ class WorkunitLoggerCallback(WorkunitsCallback):
 
     def __init__(self, wulogger: "WorkunitLogger"):
         self.wulogger = wulogger
-        self._completed_workunits: Dict[str, object] = {}
+        os.makedirs(wulogger.logdir, exist_ok=True)
+        self._filepath: Optional[str] = None
+        self._file: Optional[TextIO] = None
+        self._separator = ""
+        self._logged_span_ids: Set[str] = set()
 
     @property
     def can_finish_async(self) -> bool:
         return False
 
+    def _open(self, context: StreamingWorkunitContext) -> TextIO:
+        if self._file is None:
+            self._filepath = os.path.join(
+                self.wulogger.logdir, f"{context.run_tracker.run_id}.json"
+            )
+            self._file = open(self._filepath, "w")
+            self._file.write("[")
+        return self._file
+
     def __call__(
         self,
         *,
@@ -62,13 +71,25 @@ class WorkunitLoggerCallback(WorkunitsCallback):
         finished: bool = False,
         **kwargs: Any,
     ) -> None:
+        # Stream the completed workunits of each batch to the log as they come, rather than holding
+        # all of them in memory until the end of the run.
+        f = self._open(context)
+        # A workunit may be reported in more than one batch: only log the first occurrence.
+        new_workunits = []
         for wu in completed_workunits:
-            self._completed_workunits[wu["span_id"]] = wu
+            if wu["span_id"] not in self._logged_span_ids:
+                self._logged_span_ids.add(wu["span_id"])
+                new_workunits.append(wu)
+        if new_workunits:
+            # NB: `json.dumps` uses the C encoder, whereas `json.dump` falls back to the pure Python
+            # one in order to write the output in chunks.
+            f.write(self._separator)
+            f.write(",".join(json.dumps(just_dump(wu)) for wu in new_workunits))
+            self._separator = ","
         if finished:
-            filepath = f"{self.wulogger.logdir}/{context.run_tracker.run_id}.json"
-            with open(filepath, "w") as f:
-                json.dump(just_dump_map(self._completed_workunits), f)
-                logger.info(f"Wrote log to {filepath}")
+            f.write("]")
+            f.close()
+            logger.info(f"Wrote log to {self._filepath}")
 
 
 class WorkunitLoggerCallbackFactoryRequest:
@@ -0,0 +1,68 @@
+# Copyright 2023 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+from pants.backend.tools.workunit_logger.rules import (
+    _LOGGED_WORKUNIT_KEYS,
+    WorkunitLogger,
+    WorkunitLoggerCallback,
+)
+from pants.testutil.option_util import create_subsystem
+
+
+def _workunit(span_id: str, name: str) -> dict:
+    return {
+        "name": name,
+        "span_id": span_id,
+        "level": "INFO",
+        "parent_id": None,
+        "start_secs": 1,
+        "start_nanos": 2,
+        "description": f"Running {name}",
+        "duration_secs": 3,
+        "duration_nanos": 4,
+        "metadata": {"key": "value"},
+        # Not logged.
+        "artifacts": {"stdout_digest": "..."},
+        "counters": {"local_cache_requests": 1},
+    }
+
+
+def test_streams_each_workunit_once(tmp_path: Path) -> None:
+    logdir = tmp_path / "nested" / "logdir"
+    wulogger = create_subsystem(WorkunitLogger, enabled=True, logdir=str(logdir))
+    callback = WorkunitLoggerCallback(wulogger)
+    context = Mock(run_tracker=Mock(run_id="pants_run_1"))
+
+    callback(
+        completed_workunits=(_workunit("a", "first"), _workunit("b", "second")),
+        started_workunits=(),
+        context=context,
+    )
+    callback(
+        completed_workunits=(_workunit("b", "second"), _workunit("c", "third")),
+        started_workunits=(),
+        context=context,
+    )
+    callback(completed_workunits=(), started_workunits=(), context=context, finished=True)
+
+    logged = json.loads((logdir / "pants_run_1.json").read_text())
+    assert [wu["span_id"] for wu in logged] == ["a", "b", "c"]
+    assert [wu["name"] for wu in logged] == ["first", "second", "third"]
+    for wu in logged:
+        assert set(wu) == set(_LOGGED_WORKUNIT_KEYS)
+
+
+def test_no_completed_workunits(tmp_path: Path) -> None:
+    wulogger = create_subsystem(WorkunitLogger, enabled=True, logdir=str(tmp_path))
+    callback = WorkunitLoggerCallback(wulogger)
+    context = Mock(run_tracker=Mock(run_id="pants_run_2"))
+
+    callback(completed_workunits=(), started_workunits=(), context=context, finished=True)
+
+    assert json.loads((tmp_path / "pants_run_2.json").read_text()) == []
@@ -15,7 +15,7 @@ from pants.engine.console import Console
 from pants.engine.environment import EnvironmentName
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.process import InteractiveProcess, InteractiveProcessResult
-from pants.engine.rules import Effect, Get, MultiGet, collect_rules, goal_rule, rule
+from pants.engine.rules import Effect, Get, MultiGet, collect_rules, goal_rule
 from pants.engine.target import (
     FieldSet,
     FieldSetsPerTarget,
@@ -112,32 +112,26 @@ class Deploy(Goal):
     environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY  # TODO(#17129) — Migrate this.
 
 
-@dataclass(frozen=True)
-class _PublishProcessesForTargetRequest:
-    target: Target
-
-
-@rule
-async def publish_process_for_target(
-    request: _PublishProcessesForTargetRequest,
-) -> PublishProcesses:
-    package_field_sets, publish_field_sets = await MultiGet(
-        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PackageFieldSet, [request.target])),
-        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PublishFieldSet, [request.target])),
-    )
-
-    return await Get(
-        PublishProcesses,
-        PublishProcessesRequest(
-            package_field_sets=package_field_sets.field_sets,
-            publish_field_sets=publish_field_sets.field_sets,
-        ),
+async def _all_publish_processes(targets: Iterable[Target]) -> PublishProcesses:
+    targets = tuple(targets)
+    package_field_sets_per_target, publish_field_sets_per_target = await MultiGet(
+        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PackageFieldSet, targets)),
+        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PublishFieldSet, targets)),
     )
 
-
-async def _all_publish_processes(targets: Iterable[Target]) -> PublishProcesses:
+    # Packages are only handed to the publish field sets of the target that produced them, so
+    # there is still one `PublishProcessesRequest` per target.
     processes_per_target = await MultiGet(
-        Get(PublishProcesses, _PublishProcessesForTargetRequest(target)) for target in targets
+        Get(
+            PublishProcesses,
+            PublishProcessesRequest(
+                package_field_sets=package_field_sets,
+                publish_field_sets=publish_field_sets,
+            ),
+        )
+        for package_field_sets, publish_field_sets in zip(
+            package_field_sets_per_target.collection, publish_field_sets_per_target.collection
+        )
     )
 
     return PublishProcesses(chain.from_iterable(processes_per_target))
@@ -198,10 +192,17 @@ async def run_deploy(console: Console, deploy_subsystem: DeploySubsystem) -> Dep
         for field_set in target_roots_to_deploy_field_sets.field_sets
     )
 
+    # Several deployments may depend on the same target, which should only be published once.
     publish_targets = (
-        set(chain.from_iterable([deploy.publish_dependencies for deploy in deploy_processes]))
+        tuple(
+            {
+                tgt.address: tgt
+                for deploy in deploy_processes
+                for tgt in deploy.publish_dependencies
+            }.values()
+        )
         if deploy_subsystem.publish_dependencies
-        else set()
+        else ()
     )
 
     logger.debug(f"Found {pluralize(len(publish_targets), 'dependency')}")
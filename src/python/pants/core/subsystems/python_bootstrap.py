@@ -172,45 +172,53 @@ async def _expand_interpreter_search_paths(
         asdf_paths.local_tool_paths,
     )
 
-    special_strings = {
-        "<PEXRC>": _get_pex_python_paths,
-        "<PATH>": lambda: path_env,
-        AsdfPathString.STANDARD: lambda: asdf_standard_tool_paths,
-        AsdfPathString.LOCAL: lambda: asdf_local_tool_paths,
-    }
-
     expanded: list[str] = []
     from_pexrc = None
-
-    pyenv_env = await Get(EnvironmentVars, EnvironmentVarsRequest(("PYENV_ROOT", "HOME")))
-    pyenv_root = _get_pyenv_root(pyenv_env)
-    pyenv_path_results = await MultiGet(
-        Get(
-            VersionManagerSearchPaths,
-            VersionManagerSearchPathsRequest(
-                env_tgt,
-                pyenv_root,
-                "versions",
-                f"[{PythonBootstrapSubsystem.options_scope}].search_path",
-                (".python-version",),
-                s if s == "<PYENV_LOCAL>" else None,
-            ),
-        )
-        for s in interpreter_search_paths
-        if s == "<PYENV>" or s == "<PYENV_LOCAL>"
-    )
-    for pyenv_path in FrozenOrderedSet(itertools.chain.from_iterable(pyenv_path_results)):
-        expanded.append(pyenv_path)
+    # The pyenv strings are resolved together after this pass, and their paths are spliced in at the
+    # position of the first of them.
+    pyenv_strings: list[str] = []
+    pyenv_index = 0
     for s in interpreter_search_paths:
-        if s in special_strings:
-            special_paths = special_strings[s]()
-            if s == "<PEXRC>":
-                from_pexrc = special_paths
-            expanded.extend(special_paths)
+        if s == "<PATH>":
+            expanded.extend(path_env)
+        elif s == "<PEXRC>":
+            from_pexrc = _get_pex_python_paths()
+            expanded.extend(from_pexrc)
+        elif s == AsdfPathString.STANDARD:
+            expanded.extend(asdf_standard_tool_paths)
+        elif s == AsdfPathString.LOCAL:
+            expanded.extend(asdf_local_tool_paths)
         elif s == "<PYENV>" or s == "<PYENV_LOCAL>":
-            continue
+            if not pyenv_strings:
+                pyenv_index = len(expanded)
+            pyenv_strings.append(s)
         else:
             expanded.append(s)
+
+    if pyenv_strings:
+        # Only look up the pyenv root if it is going to be used.
+        pyenv_env = await Get(EnvironmentVars, EnvironmentVarsRequest(("PYENV_ROOT", "HOME")))
+        pyenv_root = _get_pyenv_root(pyenv_env)
+        pyenv_path_results = await MultiGet(
+            Get(
+                VersionManagerSearchPaths,
+                VersionManagerSearchPathsRequest(
+                    env_tgt,
+                    pyenv_root,
+                    "versions",
+                    f"[{PythonBootstrapSubsystem.options_scope}].search_path",
+                    (".python-version",),
+                    s if s == "<PYENV_LOCAL>" else None,
+                ),
+            )
+            for s in pyenv_strings
+        )
+        expanded[pyenv_index:pyenv_index] = itertools.chain.from_iterable(pyenv_path_results)
+
+    # The same path may be found through several entries, e.g. a pyenv version that is also on the
+    # PATH: only keep its first occurrence.
+    expanded = list(FrozenOrderedSet(expanded))
+
     # Some special-case logging to avoid misunderstandings.
     if from_pexrc and len(expanded) > len(from_pexrc):
         logger.info(
@@ -10,6 +10,7 @@ from typing import Iterable, List, Sequence, TypeVar
 import pytest
 
 from pants.base.build_environment import get_pants_cachedir
+from pants.core.subsystems import python_bootstrap
 from pants.core.subsystems.python_bootstrap import (
     _ExpandInterpreterSearchPathsRequest,
     _get_pex_python_paths,
@@ -200,3 +201,42 @@ def test_expand_interpreter_search_paths(rule_runner: RuleRunner) -> None:
         "/qux",
     )
     assert set(expected) == set(expanded_paths.paths)
+
+
+def test_expand_interpreter_search_paths_without_pyenv(
+    rule_runner: RuleRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail_pyenv_root_lookup(env: EnvironmentVars) -> str | None:
+        raise AssertionError("The pyenv root should not be looked up without a pyenv search path.")
+
+    monkeypatch.setattr(python_bootstrap, "_get_pyenv_root", fail_pyenv_root_lookup)
+    # NB: Neither HOME nor PYENV_ROOT is set, so no pyenv paths can be found either way.
+    rule_runner.set_session_values(
+        {CompleteEnvironmentVars: CompleteEnvironmentVars({"PATH": "/env/path1:/env/path2"})}
+    )
+    expanded_paths = rule_runner.request(
+        _SearchPaths,
+        [
+            _ExpandInterpreterSearchPathsRequest(
+                ("/foo", "<PATH>", "/bar"),
+                EnvironmentTarget("name", LocalEnvironmentTarget({}, Address("flem"))),
+            )
+        ],
+    )
+    assert expanded_paths.paths == ("/foo", "/env/path1", "/env/path2", "/bar")
+
+
+def test_expand_interpreter_search_paths_deduplicates(rule_runner: RuleRunner) -> None:
+    rule_runner.set_session_values(
+        {CompleteEnvironmentVars: CompleteEnvironmentVars({"PATH": "/foo:/bar"})}
+    )
+    expanded_paths = rule_runner.request(
+        _SearchPaths,
+        [
+            _ExpandInterpreterSearchPathsRequest(
+                ("/foo", "<PATH>", "/baz", "/bar"),
+                EnvironmentTarget("name", LocalEnvironmentTarget({}, Address("flem"))),
+            )
+        ],
+    )
+    assert expanded_paths.paths == ("/foo", "/bar", "/baz")
@@ -7,7 +7,6 @@ import logging
 import os
 import shlex
 from dataclasses import dataclass
-from pathlib import PurePath
 
 from pants.core.util_rules import system_binaries
 from pants.core.util_rules.adhoc_binaries import GunzipBinary
@@ -59,12 +58,22 @@ async def create_archive(
     file_list_file = FileContent(
         FILE_LIST_FILENAME, "\n".join(request.snapshot.files).encode("utf-8")
     )
-    file_list_file_digest = await Get(Digest, CreateDigest([file_list_file]))
-    files_digests = [file_list_file_digest, request.snapshot.digest]
-    input_digests = []
+    # The file list and any output directory are created in a single digest, concurrently with
+    # finding the archive binaries.
+    created_entries: list[FileContent | Directory] = [file_list_file]
+    if request.format != ArchiveFormat.ZIP:
+        # `tar` requires that the output filename's parent directory exists, so if the caller
+        # wants the output in a directory we explicitly create it here.
+        # We have to guard this path as the Rust code will crash if we give it empty paths.
+        output_dir = os.path.dirname(request.output_filename)
+        if output_dir != "":
+            created_entries.append(Directory(output_dir))
+    created_digest_get = Get(Digest, CreateDigest(created_entries))
 
     if request.format == ArchiveFormat.ZIP:
-        zip_binary, bash_binary = await MultiGet(Get(ZipBinary), Get(BashBinary))
+        created_digest, zip_binary, bash_binary = await MultiGet(
+            created_digest_get, Get(ZipBinary), Get(BashBinary)
+        )
         env = {}
         argv: tuple[str, ...] = (
             bash_binary.path,
@@ -77,24 +86,16 @@ async def create_archive(
             ),
         )
     else:
-        tar_binary = await Get(TarBinary)
+        created_digest, tar_binary = await MultiGet(created_digest_get, Get(TarBinary))
         argv = tar_binary.create_archive_argv(
             request.output_filename,
             request.format,
             input_file_list_filename=FILE_LIST_FILENAME,
         )
         # `tar` expects to find a couple binaries like `gzip` and `xz` by looking on the PATH.
-        env = {"PATH": os.pathsep.join(system_binaries_environment.system_binary_paths)}
-
-        # `tar` requires that the output filename's parent directory exists, so if the caller
-        # wants the output in a directory we explicitly create it here.
-        # We have to guard this path as the Rust code will crash if we give it empty paths.
-        output_dir = os.path.dirname(request.output_filename)
-        if output_dir != "":
-            output_dir_digest = await Get(Digest, CreateDigest([Directory(output_dir)]))
-            input_digests.append(output_dir_digest)
+        env = {"PATH": system_binaries_environment.system_binary_path_env}
 
-    input_digest = await Get(Digest, MergeDigests([*files_digests, *input_digests]))
+    input_digest = await Get(Digest, MergeDigests([created_digest, request.snapshot.digest]))
 
     result = await Get(
         ProcessResult,
@@ -141,6 +142,22 @@ async def convert_digest_to_MaybeExtractArchiveRequest(
     return MaybeExtractArchiveRequest(digest)
 
 
+# Suffixes of tar archives, and the compression suffixes that denote a tar archive when preceded
+# by `.tar`.
+_TAR_SUFFIXES = frozenset((".tar", ".tgz", ".tbz2", ".txz"))
+_TAR_COMPRESSION_SUFFIXES = frozenset((".gz", ".bz2", ".xz", ".lz4"))
+
+
+def _archive_suffix(archive_path: str) -> str:
+    """Equivalent to `"".join(PurePath(archive_path).suffixes)`, without parsing a whole path."""
+    name = os.path.basename(archive_path)
+    if name.endswith("."):
+        return ""
+    name = name.lstrip(".")
+    dot = name.find(".")
+    return name[dot:] if dot != -1 else ""
+
+
 @rule(desc="Extracting an archive file", level=LogLevel.DEBUG)
 async def maybe_extract_archive(
     request: MaybeExtractArchiveRequest,
@@ -156,12 +173,13 @@ async def maybe_extract_archive(
         return ExtractedArchive(request.digest)
 
     archive_path = snapshot.files[0]
-    archive_suffix = request.use_suffix or "".join(PurePath(archive_path).suffixes)
-    is_zip = archive_suffix.endswith(".zip")
-    is_tar = archive_suffix.endswith(
-        (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz", ".tar.lz4")
+    archive_suffix = request.use_suffix or _archive_suffix(archive_path)
+    last_suffix = archive_suffix[archive_suffix.rfind(".") :]
+    is_zip = last_suffix == ".zip"
+    is_tar = last_suffix in _TAR_SUFFIXES or (
+        last_suffix in _TAR_COMPRESSION_SUFFIXES and archive_suffix.endswith(f".tar{last_suffix}")
     )
-    is_gz = not is_tar and archive_suffix.endswith(".gz")
+    is_gz = not is_tar and last_suffix == ".gz"
     if not is_zip and not is_tar and not is_gz:
         return ExtractedArchive(request.digest)
 
@@ -177,7 +195,7 @@ async def maybe_extract_archive(
             archive_path, extract_archive_dir, archive_suffix=archive_suffix
         )
         # `tar` expects to find a couple binaries like `gzip` and `xz` by looking on the PATH.
-        env = {"PATH": os.pathsep.join(system_binaries_environment.system_binary_paths)}
+        env = {"PATH": system_binaries_environment.system_binary_path_env}
     else:
         input_digest, gunzip = await MultiGet(merge_digest_get, Get(GunzipBinary))
         argv = gunzip.extract_archive_argv(archive_path, extract_archive_dir)
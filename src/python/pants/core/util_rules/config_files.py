@@ -13,7 +13,7 @@ from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.engine.fs import EMPTY_SNAPSHOT, DigestContents, PathGlobs, Snapshot
 from pants.engine.rules import Get, collect_rules, rule
 from pants.util.collections import ensure_str_list
-from pants.util.dirutil import find_nearest_ancestor_file
+from pants.util.dirutil import find_nearest_ancestor_files
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
@@ -129,11 +129,13 @@ async def gather_config_files_by_workspace_dir(
     ]
     config_files_snapshot = await Get(Snapshot, PathGlobs(config_file_globs))
     config_files_set = set(config_files_snapshot.files)
+    nearest_config_files = find_nearest_ancestor_files(
+        config_files_set, source_dirs, request.config_filename
+    )
+
     source_dir_to_config_file: dict[str, str] = {}
     for source_dir in source_dirs:
-        config_file = find_nearest_ancestor_file(
-            config_files_set, source_dir, request.config_filename
-        )
+        config_file = nearest_config_files[source_dir]
         if config_file:
             source_dir_to_config_file[source_dir] = config_file
         else:
@@ -92,9 +92,11 @@ async def get_un_cachable_version_manager_paths(
             return VersionManagerSearchPaths([str(path)])
         return VersionManagerSearchPaths()
 
-    versions_in_dir = (
-        tool_versions_path / version / "bin" for version in sorted(tool_versions_path.iterdir())
-    )
+    # NB: `os.scandir` reports the entry types along with the directory listing, so plain files in
+    # the versions directory are skipped without a stat call each.
+    with os.scandir(tool_versions_path) as entries:
+        versions = sorted(entry.name for entry in entries if entry.is_dir())
+    versions_in_dir = (tool_versions_path / version / "bin" for version in versions)
     return VersionManagerSearchPaths(
         str(version) for version in versions_in_dir if version.is_dir()
     )
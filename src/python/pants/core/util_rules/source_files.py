@@ -1,6 +1,9 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import fnmatch
+import posixpath
+import re
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Collection, Iterable, Set, Tuple, Type, Union
@@ -46,7 +49,6 @@ class SourceFilesRequest:
 @rule(desc="Get all relevant source files")
 async def determine_source_files(request: SourceFilesRequest) -> SourceFiles:
     """Merge all `SourceBaseField`s into one Snapshot."""
-    unrooted_files: Set[str] = set()
     all_hydrated_sources = await MultiGet(
         Get(
             HydratedSources,
@@ -59,14 +61,17 @@ async def determine_source_files(request: SourceFilesRequest) -> SourceFiles:
         for sources_field in request.sources_fields
     )
 
-    for hydrated_sources, sources_field in zip(all_hydrated_sources, request.sources_fields):
-        if not sources_field.uses_source_roots:
-            unrooted_files.update(hydrated_sources.snapshot.files)
+    unrooted_files = {
+        path
+        for hydrated_sources, sources_field in zip(all_hydrated_sources, request.sources_fields)
+        if not sources_field.uses_source_roots
+        for path in hydrated_sources.snapshot.files
+    }
 
-    digests_to_merge = tuple(
-        hydrated_sources.snapshot.digest for hydrated_sources in all_hydrated_sources
+    result = await Get(
+        Snapshot,
+        MergeDigests(hydrated_sources.snapshot.digest for hydrated_sources in all_hydrated_sources),
     )
-    result = await Get(Snapshot, MergeDigests(digests_to_merge))
     return SourceFiles(result, tuple(sorted(unrooted_files)))
 
 
@@ -89,12 +94,25 @@ def classify_files_for_sources_and_tests(
     collected for the target generators to own sources code (`language-name_sources` targets) and
     tests code (`language-name_tests` targets).
     """
-    sources_files = set(paths)
-    test_files = {
-        path for path in paths if any(PurePath(path).match(glob) for glob in test_file_glob)
-    }
-    if sources_files:
-        yield ClassifiedSources(sources_generator, files=sources_files - test_files)
+    # Globs of a single path component (the common case) only ever match the file name, so they are
+    # all matched at once with a regex rather than with `PurePath.match` per glob and per path.
+    name_globs = [glob for glob in test_file_glob if "/" not in glob]
+    path_globs = [glob for glob in test_file_glob if "/" in glob]
+    name_regex = (
+        re.compile("|".join(fnmatch.translate(glob) for glob in name_globs)) if name_globs else None
+    )
+
+    def is_test_file(path: str) -> bool:
+        if name_regex and name_regex.match(posixpath.basename(path)):
+            return True
+        return any(PurePath(path).match(glob) for glob in path_globs)
+
+    sources_files: Set[str] = set()
+    test_files: Set[str] = set()
+    for path in paths:
+        (test_files if is_test_file(path) else sources_files).add(path)
+    if sources_files or test_files:
+        yield ClassifiedSources(sources_generator, files=sources_files)
     if test_files:
         yield ClassifiedSources(tests_generator, test_files, "tests")
 
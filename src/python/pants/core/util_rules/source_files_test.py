@@ -10,8 +10,17 @@ from typing import Iterable, NamedTuple
 
 import pytest
 
-from pants.core.target_types import FileSourceField
-from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.core.target_types import (
+    FilesGeneratorTarget,
+    FileSourceField,
+    ResourcesGeneratorTarget,
+)
+from pants.core.util_rules.source_files import (
+    ClassifiedSources,
+    SourceFiles,
+    SourceFilesRequest,
+    classify_files_for_sources_and_tests,
+)
 from pants.core.util_rules.source_files import rules as source_files_rules
 from pants.engine.addresses import Address
 from pants.engine.target import MultipleSourcesField, SourcesField
@@ -119,3 +128,22 @@ def test_unrooted_sources(rule_runner: RuleRunner) -> None:
 def test_gracefully_handle_no_sources(rule_runner: RuleRunner) -> None:
     sources_field = mock_sources_field(rule_runner, SOURCES1, include_sources=False)
     assert_sources_resolved(rule_runner, [sources_field], expected=[])
+
+
+def test_classify_files_for_sources_and_tests() -> None:
+    classified = list(
+        classify_files_for_sources_and_tests(
+            paths=["src/app.py", "src/app_test.py", "src/test_util.py", "tests/data/app.py"],
+            test_file_glob=("*_test.py", "test_*.py", "tests/*/*.py"),
+            sources_generator=FilesGeneratorTarget,
+            tests_generator=ResourcesGeneratorTarget,
+        )
+    )
+    assert classified == [
+        ClassifiedSources(FilesGeneratorTarget, {"src/app.py"}),
+        ClassifiedSources(
+            ResourcesGeneratorTarget,
+            {"src/app_test.py", "src/test_util.py", "tests/data/app.py"},
+            "tests",
+        ),
+    ]
@@ -70,6 +70,11 @@ class SystemBinariesSubsystem(Subsystem):
 
             return SearchPath(iter_path_entries())
 
+        @memoized_property
+        def system_binary_path_env(self) -> str:
+            """The `system_binary_paths` joined as the value of a PATH env var."""
+            return os.pathsep.join(self.system_binary_paths)
+
 
 # -------------------------------------------------------------------------------------------
 # `BinaryPath` types
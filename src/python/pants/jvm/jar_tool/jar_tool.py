@@ -10,18 +10,13 @@ from typing import Iterable, Mapping
 
 import pkg_resources
 
-from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.core.goals.generate_lockfiles import DEFAULT_TOOL_LOCKFILE, GenerateToolLockfileSentinel
 from pants.engine.fs import (
     CreateDigest,
     Digest,
-    DigestEntries,
-    DigestSubset,
     Directory,
     FileContent,
-    FileEntry,
     MergeDigests,
-    PathGlobs,
     RemovePrefix,
 )
 from pants.engine.process import ProcessResult
@@ -35,6 +30,7 @@ from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool
 from pants.jvm.resolve.jvm_tool import rules as jvm_tool_rules
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.memo import memoized
 from pants.util.ordered_set import FrozenOrderedSet
 
 
@@ -127,17 +123,33 @@ async def run_jar_tool(
 ) -> Digest:
     output_prefix = "__out"
     output_jarname = os.path.join(output_prefix, request.jar_name)
+    input_prefix = "__in"
+
+    # The lists of jars and files can be as long as a whole classpath, so rather than on the command
+    # line, they are passed to the jar tool in argfiles.
+    argfiles_prefix = "__args"
+    jars_argfile = os.path.join(argfiles_prefix, "jars")
+    files_argfile = os.path.join(argfiles_prefix, "files")
+    jars = ",".join(os.path.join(input_prefix, jar) for jar in request.jars)
+    file_mappings = ",".join(
+        f"{os.path.join(input_prefix, fs_path)}={jar_path}"
+        for fs_path, jar_path in request.file_mappings.items()
+    )
+    argfiles = [
+        FileContent(argfile, content.encode("utf-8"))
+        for argfile, content in ((jars_argfile, jars), (files_argfile, file_mappings))
+        if content
+    ]
 
-    lockfile_request, empty_output_digest = await MultiGet(
+    lockfile_request, input_digest = await MultiGet(
         Get(GenerateJvmLockfileFromTool, JarToolGenerateLockfileSentinel()),
-        Get(Digest, CreateDigest([Directory(output_prefix)])),
+        Get(Digest, CreateDigest([Directory(output_prefix), *argfiles])),
     )
 
     tool_classpath = await Get(ToolClasspath, ToolClasspathRequest(lockfile=lockfile_request))
 
     toolcp_prefix = "__toolcp"
     jartoolcp_prefix = "__jartoolcp"
-    input_prefix = "__in"
     immutable_input_digests = {
         toolcp_prefix: tool_classpath.digest,
         jartoolcp_prefix: jar_tool.digest,
@@ -147,10 +159,6 @@ async def run_jar_tool(
     policies = ",".join(
         f"{pattern}={action.value.upper()}" for (pattern, action) in request.policies
     )
-    file_mappings = ",".join(
-        f"{os.path.join(input_prefix, fs_path)}={jar_path}"
-        for fs_path, jar_path in request.file_mappings.items()
-    )
 
     tool_process = JvmProcess(
         jdk=jdk,
@@ -168,12 +176,8 @@ async def run_jar_tool(
                 if request.manifest
                 else ()
             ),
-            *(
-                (f"-jars={','.join([os.path.join(input_prefix, jar) for jar in request.jars])}",)
-                if request.jars
-                else ()
-            ),
-            *((f"-files={file_mappings}",) if file_mappings else ()),
+            *((f"-jars=@{jars_argfile}",) if jars else ()),
+            *((f"-files=@{files_argfile}",) if file_mappings else ()),
             *(
                 (f"-default_action={request.default_action.value.upper()}",)
                 if request.default_action
@@ -185,7 +189,7 @@ async def run_jar_tool(
             *(("-update",) if request.update else ()),
         ],
         classpath_entries=[*tool_classpath.classpath_entries(toolcp_prefix), jartoolcp_prefix],
-        input_digest=empty_output_digest,
+        input_digest=input_digest,
         extra_immutable_input_digests=immutable_input_digests,
         extra_nailgun_keys=immutable_input_digests.keys(),
         description=f"Building jar {request.jar_name}",
@@ -200,7 +204,8 @@ async def run_jar_tool(
 _JAR_TOOL_SRC_PACKAGES = ["args4j", "jar_tool_source"]
 
 
-def _load_jar_tool_sources() -> list[FileContent]:
+@memoized
+def _load_jar_tool_sources() -> tuple[FileContent, ...]:
     result = []
     for package in _JAR_TOOL_SRC_PACKAGES:
         # pkg_path = package.replace(".", os.path.sep)
@@ -214,44 +219,29 @@ def _load_jar_tool_sources() -> list[FileContent]:
                     ),
                 )
             )
-    return result
+    return tuple(result)
 
 
 # TODO(13879): Consolidate compilation of wrapper binaries to common rules.
 @rule
 async def build_jar_tool(jdk: InternalJdk) -> JarToolCompiledClassfiles:
-    lockfile_request, source_digest = await MultiGet(
-        Get(GenerateJvmLockfileFromTool, JarToolGenerateLockfileSentinel()),
-        Get(
-            Digest,
-            CreateDigest(_load_jar_tool_sources()),
-        ),
+    jar_tool_sources = _load_jar_tool_sources()
+    # The sources are known up front, so there is no need to glob the digest for them. Resource
+    # listings are in filesystem order, so sort them to keep the argv (and the cache key) stable.
+    java_sources = sorted(
+        source.path for source in jar_tool_sources if source.path.endswith(".java")
     )
 
     dest_dir = "classfiles"
-    materialized_classpath, java_subset_digest, empty_dest_dir = await MultiGet(
-        Get(ToolClasspath, ToolClasspathRequest(prefix="__toolcp", lockfile=lockfile_request)),
-        Get(
-            Digest,
-            DigestSubset(
-                source_digest,
-                PathGlobs(
-                    ["**/*.java"],
-                    glob_match_error_behavior=GlobMatchErrorBehavior.error,
-                    description_of_origin="jar tool sources",
-                ),
-            ),
-        ),
-        Get(Digest, CreateDigest([Directory(path=dest_dir)])),
+    lockfile_request, source_digest = await MultiGet(
+        Get(GenerateJvmLockfileFromTool, JarToolGenerateLockfileSentinel()),
+        Get(Digest, CreateDigest([*jar_tool_sources, Directory(path=dest_dir)])),
     )
 
-    merged_digest, src_entries = await MultiGet(
-        Get(
-            Digest,
-            MergeDigests([materialized_classpath.digest, source_digest, empty_dest_dir]),
-        ),
-        Get(DigestEntries, Digest, java_subset_digest),
+    materialized_classpath = await Get(
+        ToolClasspath, ToolClasspathRequest(prefix="__toolcp", lockfile=lockfile_request)
     )
+    merged_digest = await Get(Digest, MergeDigests([materialized_classpath.digest, source_digest]))
 
     compile_result = await Get(
         ProcessResult,
@@ -260,11 +250,12 @@ async def build_jar_tool(jdk: InternalJdk) -> JarToolCompiledClassfiles:
             classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
             argv=[
                 "com.sun.tools.javac.Main",
+                "-proc:none",
                 "-cp",
                 ":".join(materialized_classpath.classpath_entries()),
                 "-d",
                 dest_dir,
-                *[entry.path for entry in src_entries if isinstance(entry, FileEntry)],
+                *java_sources,
             ],
             input_digest=merged_digest,
             output_directories=(dest_dir,),
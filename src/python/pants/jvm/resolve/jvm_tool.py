@@ -23,6 +23,7 @@ from pants.jvm.target_types import JvmArtifactFieldSet
 from pants.option.option_types import StrListOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name, git_url
+from pants.util.memo import memoized_property
 from pants.util.meta import classproperty
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import softwrap
@@ -117,7 +118,7 @@ class JvmToolBase(Subsystem, ExportableTool):
             """
         )
 
-    @property
+    @memoized_property
     def artifact_inputs(self) -> tuple[str, ...]:
         return tuple(s.format(version=self.version) for s in self.artifacts)
 
@@ -4,10 +4,8 @@
 from dataclasses import dataclass
 from typing import Tuple
 
-import pkg_resources
-
 from pants.core.goals.generate_lockfiles import DEFAULT_TOOL_LOCKFILE, GenerateToolLockfileSentinel
-from pants.engine.fs import AddPrefix, CreateDigest, Digest, Directory, FileContent
+from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, Directory, FileContent
 from pants.engine.internals.native_engine import MergeDigests, RemovePrefix
 from pants.engine.process import FallibleProcessResult, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
@@ -16,7 +14,9 @@ from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, GenerateJvmToolLockfileSentinel
 from pants.util.logging import LogLevel
+from pants.util.memo import memoized
 from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.resources import read_resource
 
 _STRIP_JAR_BASENAME = "StripJar.java"
 _OUTPUT_PATH = "__stripped_jars"
@@ -58,19 +58,16 @@ async def strip_jar(
     processorcp_relpath = "__processorcp"
 
     lockfile_request = await Get(GenerateJvmLockfileFromTool, StripJarToolLockfileSentinel())
-
-    tool_classpath, prefixed_jars_digest = await MultiGet(
-        Get(
-            ToolClasspath,
-            ToolClasspathRequest(lockfile=lockfile_request),
-        ),
-        Get(Digest, AddPrefix(request.digest, input_path)),
-    )
+    tool_classpath = await Get(ToolClasspath, ToolClasspathRequest(lockfile=lockfile_request))
 
     extra_immutable_input_digests = {
         toolcp_relpath: tool_classpath.digest,
         processorcp_relpath: processor_classfiles.digest,
     }
+    extra_nailgun_keys = tuple(extra_immutable_input_digests)
+    # The jars are only read, so they can be provided as an immutable input rather than being
+    # prefixed into the input digest.
+    extra_immutable_input_digests[input_path] = request.digest
 
     process_result = await Get(
         ProcessResult,
@@ -81,10 +78,10 @@ async def strip_jar(
                 processorcp_relpath,
             ],
             argv=["org.pantsbuild.stripjar.StripJar", input_path, _OUTPUT_PATH, *filenames],
-            input_digest=prefixed_jars_digest,
+            input_digest=EMPTY_DIGEST,
             extra_immutable_input_digests=extra_immutable_input_digests,
             output_directories=(_OUTPUT_PATH,),
-            extra_nailgun_keys=extra_immutable_input_digests,
+            extra_nailgun_keys=extra_nailgun_keys,
             description=f"Stripping jar {filenames[0]}",
             level=LogLevel.DEBUG,
         ),
@@ -93,20 +90,17 @@ async def strip_jar(
     return await Get(Digest, RemovePrefix(process_result.output_digest, _OUTPUT_PATH))
 
 
+@memoized
 def _load_strip_jar_source() -> bytes:
-    return pkg_resources.resource_string(__name__, _STRIP_JAR_BASENAME)
+    return read_resource(__name__, _STRIP_JAR_BASENAME)
 
 
 # TODO(13879): Consolidate compilation of wrapper binaries to common rules.
 @rule
 async def build_processors(jdk: InternalJdk) -> StripJarCompiledClassfiles:
     dest_dir = "classfiles"
-    lockfile_request = await Get(GenerateJvmLockfileFromTool, StripJarToolLockfileSentinel())
-    materialized_classpath, source_digest = await MultiGet(
-        Get(
-            ToolClasspath,
-            ToolClasspathRequest(prefix="__toolcp", lockfile=lockfile_request),
-        ),
+    lockfile_request, source_digest = await MultiGet(
+        Get(GenerateJvmLockfileFromTool, StripJarToolLockfileSentinel()),
         Get(
             Digest,
             CreateDigest(
@@ -120,6 +114,9 @@ async def build_processors(jdk: InternalJdk) -> StripJarCompiledClassfiles:
             ),
         ),
     )
+    materialized_classpath = await Get(
+        ToolClasspath, ToolClasspathRequest(prefix="__toolcp", lockfile=lockfile_request)
+    )
 
     merged_digest = await Get(
         Digest,
@@ -138,6 +135,7 @@ async def build_processors(jdk: InternalJdk) -> StripJarCompiledClassfiles:
             classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
             argv=[
                 "com.sun.tools.javac.Main",
+                "-proc:none",
                 "-cp",
                 ":".join(materialized_classpath.classpath_entries()),
                 "-d",
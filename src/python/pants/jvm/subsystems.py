@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from pants.option.option_types import BoolOption, DictOption, IntOption, StrListOption, StrOption
 from pants.option.subsystem import Subsystem
+from pants.util.memo import memoized_property
 from pants.util.strutil import help_text, softwrap
 
 
@@ -137,3 +138,8 @@ class JvmSubsystem(Subsystem):
         ),
         advanced=True,
     )
+
+    @memoized_property
+    def resolve_names(self) -> frozenset[str]:
+        """The names of the resolves in `[jvm].resolves`."""
+        return frozenset(self.resolves)
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import dataclasses
 import re
+import sys
 import xml.etree.ElementTree as ET
 from abc import ABC, ABCMeta, abstractmethod
 from dataclasses import dataclass
@@ -59,7 +60,20 @@ class JvmDependenciesField(Dependencies):
     pass
 
 
-class JvmResolveField(StringField, AsyncFieldMixin):
+class _InternedStringField(StringField):
+    """A `StringField` whose values are interned.
+
+    The same values are repeated across many targets, e.g. the `group` of artifacts from a single
+    organization, or the `resolve` of every target in a repository.
+    """
+
+    @classmethod
+    def compute_value(cls, raw_value: Optional[str], address: Address) -> Optional[str]:
+        value_or_default = super().compute_value(raw_value, address)
+        return sys.intern(value_or_default) if value_or_default is not None else None
+
+
+class JvmResolveField(_InternedStringField, AsyncFieldMixin):
     alias = "resolve"
     required = False
     help = help_text(
@@ -74,7 +88,7 @@ class JvmResolveField(StringField, AsyncFieldMixin):
     def normalized_value(self, jvm_subsystem: JvmSubsystem) -> str:
         """Get the value after applying the default and validating that the key is recognized."""
         resolve = self.value or jvm_subsystem.default_resolve
-        if resolve not in jvm_subsystem.resolves:
+        if resolve not in jvm_subsystem.resolve_names:
             raise UnrecognizedResolveNamesError(
                 [resolve],
                 jvm_subsystem.resolves.keys(),
@@ -151,7 +165,7 @@ _DEFAULT_PACKAGE_MAPPING_URL = git_url(
 )
 
 
-class JvmArtifactGroupField(StringField):
+class JvmArtifactGroupField(_InternedStringField):
     alias = "group"
     required = True
     value: str
@@ -164,7 +178,7 @@ class JvmArtifactGroupField(StringField):
     )
 
 
-class JvmArtifactArtifactField(StringField):
+class JvmArtifactArtifactField(_InternedStringField):
     alias = "artifact"
     required = True
     value: str
@@ -177,7 +191,7 @@ class JvmArtifactArtifactField(StringField):
     )
 
 
-class JvmArtifactVersionField(StringField):
+class JvmArtifactVersionField(_InternedStringField):
     alias = "version"
     required = True
     value: str
@@ -722,17 +736,17 @@ class JvmShadingKeepRule(JvmShadingRule):
         return JvmShadingRule._validate_field(self.pattern, name="pattern", invalid_chars="/")
 
 
-JVM_SHADING_RULE_TYPES: list[Type[JvmShadingRule]] = [
+JVM_SHADING_RULE_TYPES: tuple[Type[JvmShadingRule], ...] = (
     JvmShadingRelocateRule,
     JvmShadingRenameRule,
     JvmShadingZapRule,
     JvmShadingKeepRule,
-]
+)
 
 
-def _shading_rules_field_help(intro: str) -> str:
-    return softwrap(
-        f"""
+def _shading_rules_field_help(intro: str) -> str | Callable[[], str]:
+    return help_text(
+        lambda: f"""
         {intro}
 
         There are {pluralize(len(JVM_SHADING_RULE_TYPES), "possible shading rule")} available,
@@ -798,21 +812,22 @@ class JvmShadingRulesField(SequenceField[JvmShadingRule], metaclass=ABCMeta):
 class DeployJarDuplicateRule:
     alias: ClassVar[str] = "duplicate_rule"
     valid_actions: ClassVar[tuple[str, ...]] = ("skip", "replace", "concat", "concat_text", "throw")
+    _valid_actions_set: ClassVar[frozenset[str]] = frozenset(valid_actions)
 
     pattern: str
     action: str
 
     def validate(self) -> str | None:
-        if self.action not in DeployJarDuplicateRule.valid_actions:
-            return softwrap(
-                f"""
-                Value '{self.action}' for `action` associated with pattern
-                '{self.pattern}' is not valid.
-
-                It must be one of {list(DeployJarDuplicateRule.valid_actions)}.
-                """
-            )
-        return None
+        if self.action in DeployJarDuplicateRule._valid_actions_set:
+            return None
+        return softwrap(
+            f"""
+            Value '{self.action}' for `action` associated with pattern
+            '{self.pattern}' is not valid.
+
+            It must be one of {list(DeployJarDuplicateRule.valid_actions)}.
+            """
+        )
 
     def __repr__(self) -> str:
         return f"{self.alias}(pattern='{self.pattern}', action='{self.action}')"
@@ -859,13 +874,9 @@ class DeployJarDuplicatePolicyField(SequenceField[DeployJarDuplicateRule]):
         cls, raw_value: Optional[Iterable[DeployJarDuplicateRule]], address: Address
     ) -> Optional[Tuple[DeployJarDuplicateRule, ...]]:
         value = super().compute_value(raw_value, address)
-        if value:
-            errors = []
-            for duplicate_rule in value:
-                err = duplicate_rule.validate()
-                if err:
-                    errors.append(err)
-
+        # The default rules are known to be valid, and are what most targets use.
+        if value and value is not cls.default:
+            errors = [err for err in (duplicate_rule.validate() for duplicate_rule in value) if err]
             if errors:
                 raise InvalidFieldException(
                     softwrap(
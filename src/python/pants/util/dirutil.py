@@ -451,11 +451,32 @@ def group_by_dir(paths: Iterable[str]) -> dict[str, set[str]]:
 
 def find_nearest_ancestor_file(files: set[str], dir: str, filename: str) -> str | None:
     """Given a filename return the nearest ancestor file of that name in the directory hierarchy."""
-    while True:
-        candidate_config_file_path = os.path.join(dir, filename)
-        if candidate_config_file_path in files:
-            return candidate_config_file_path
-
-        if dir == "":
-            return None
-        dir = os.path.dirname(dir)
+    return find_nearest_ancestor_files(files, [dir], filename)[dir]
+
+
+def find_nearest_ancestor_files(
+    files: set[str], dirs: Iterable[str], filename: str
+) -> dict[str, str | None]:
+    """Like `find_nearest_ancestor_file`, but for each of the given directories.
+
+    Directories usually share most of their ancestors, so the nearest file of every directory
+    visited is remembered, rather than walking up to the root from each of them.
+    """
+    nearest: dict[str, str | None] = {}
+    result: dict[str, str | None] = {}
+    for dir in dirs:
+        visited = []
+        ancestor = dir
+        while ancestor not in nearest:
+            visited.append(ancestor)
+            candidate = os.path.join(ancestor, filename)
+            if candidate in files:
+                nearest[ancestor] = candidate
+            elif ancestor == "":
+                nearest[ancestor] = None
+            else:
+                ancestor = os.path.dirname(ancestor)
+        for visited_dir in visited:
+            nearest[visited_dir] = nearest[ancestor]
+        result[dir] = nearest[ancestor]
+    return result
@@ -20,6 +20,7 @@ from pants.util.dirutil import (
     absolute_symlink,
     fast_relpath,
     find_nearest_ancestor_file,
+    find_nearest_ancestor_files,
     group_by_dir,
     longest_dir_prefix,
     read_file,
@@ -460,3 +461,32 @@ def test_find_nearest_ancestor_file() -> None:
     assert find_nearest_ancestor_file(files2, "foo", "grok.conf") is None
     assert find_nearest_ancestor_file(files2, "foo/", "grok.conf") is None
     assert find_nearest_ancestor_file(files2, "", "grok.conf") is None
+
+
+def test_find_nearest_ancestor_files() -> None:
+    files = {"grok.conf", "foo/bar/grok.conf", "hello/world/grok.conf"}
+    assert find_nearest_ancestor_files(
+        files,
+        ["foo/bar/baz", "foo/bar", "foo/xyzzy", "foo/", "hello/world/foo/", "hello", ""],
+        "grok.conf",
+    ) == {
+        "foo/bar/baz": "foo/bar/grok.conf",
+        "foo/bar": "foo/bar/grok.conf",
+        "foo/xyzzy": "grok.conf",
+        "foo/": "grok.conf",
+        "hello/world/foo/": "hello/world/grok.conf",
+        "hello": "grok.conf",
+        "": "grok.conf",
+    }
+
+    files2 = {"foo/bar/grok.conf", "hello/world/grok.conf"}
+    assert find_nearest_ancestor_files(
+        files2, ["foo/bar/baz", "foo/xyzzy", "foo", "hello/world", "hello"], "grok.conf"
+    ) == {
+        "foo/bar/baz": "foo/bar/grok.conf",
+        "foo/xyzzy": None,
+        "foo": None,
+        "hello/world": "hello/world/grok.conf",
+        "hello": None,
+    }
+    assert find_nearest_ancestor_files(files2, [], "grok.conf") == {}